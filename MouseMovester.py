@@ -11,6 +11,7 @@ and the Start menu area.
 
 Dependencies:
 - pyautogui: For controlling mouse movements and clicks.
+- numpy: For the precomputed lookup mask of regions to avoid clicking.
 - pywin32: For Windows-specific API calls to detect primary monitor dimensions
            and potentially query window information (though direct UI element
            detection is limited).
@@ -19,55 +20,241 @@ Usage:
 1. Run `setup.bat` to install necessary Python packages.
 2. Run `start_mouse_mover.bat` to start the program.
 3. To stop the program, move the mouse cursor to the top-left corner of the screen
-   (pyautogui's failsafe) or press Ctrl+C in the console.
+   (failsafe) or press Ctrl+C in the console.
+4. Pass `--quiet` to skip the per-click status line during long unattended runs.
 
 Defensive Programming Notes:
 - Error handling: `try-except` blocks are used for API calls and mouse operations.
-- Failsafe: `pyautogui.FAILSAFE` is enabled for emergency program termination.
-- Threading: Uses a separate thread for the mouse movement loop to keep the main
-  program responsive.
+- Failsafe: Moving the mouse to the top-left corner stops the program, both on
+  the Win32 path and (via `pyautogui.FAILSAFE`) on the pyautogui fallback.
+- Asyncio: Runs the mouse movement loop on an asyncio event loop with a single
+  pending click timer. Stopping cancels that timer immediately instead of
+  waiting for it to elapse, and a display change replaces it with a new one.
 - UI Avoidance (Best Effort): Implements a basic heuristic to avoid clicking
   in areas commonly occupied by window control buttons and the Start menu.
   This is not foolproof due to the dynamic nature of UI elements but aims
   to reduce unintended interactions.
 """
 
-import pyautogui  # Used for controlling mouse movements and clicks
-import random     # Used for generating random coordinates
-import time       # Used for delays and timing
+import argparse   # Used for parsing command-line options in main
+import logging    # Used for reporting status and errors to the console
+import time       # Used for the local UTC offset in log timestamps
 import sys        # Used for system-specific parameters and functions (e.g., sys.exit)
-import threading  # Used for running the mouse movement loop in a separate thread
-from typing import Tuple # Used for type hinting
+import threading  # Used for the display change listener thread
+import asyncio    # Used for running the mouse movement loop as a cancellable task
+import ctypes     # Used for calling the Win32 SendInput API directly
+import itertools  # Used for pairing up avoidance regions when merging them
+from collections import deque # Used for the pool of pre-sampled click positions
+from ctypes import wintypes # Win32 type definitions for the SendInput structures
+from typing import List, Optional, Tuple # Used for type hinting
+
+import numpy as np  # Used for the precomputed avoidance-region mask
+
+# Status and error messages go through this logger; `main` attaches the
+# console handler (see `_configure_logging`).
+logger = logging.getLogger("mover")
 
 try:
     # Attempt to import win32api and win32con for Windows-specific monitor detection.
     # These modules are part of the pywin32 package.
     import win32api
     import win32con
+    import win32gui
     WINDOWS_AVAILABLE = True
 except ImportError:
     # If pywin32 is not installed or not on Windows, set flag to False
     WINDOWS_AVAILABLE = False
-    print("Warning: win32api not available. Will use pyautogui screen detection, which may not accurately detect primary monitor in multi-monitor setups.")
+
+
+class _UnflushedStreamHandler(logging.StreamHandler):
+    """
+    A StreamHandler that leaves flushing to the stream's own buffering.
+    logging.StreamHandler flushes after every record; skipping that keeps the
+    per-click status line from forcing a flush. An interactive console is line
+    buffered, so lines still show up at once, while redirected output is
+    written in batches. `_flush_log` flushes explicitly on stop and exit.
+    """
+
+    def flush(self):
+        pass
+
+
+class _ClockFormatter(logging.Formatter):
+    """
+    Formats `%(asctime)s` as HH:MM:SS using integer arithmetic on the record's
+    epoch seconds, instead of the time.localtime + time.strftime pair that
+    logging.Formatter.formatTime runs for every record. The local UTC offset
+    is looked up once per hour, which also picks up daylight saving changes.
+    """
+
+    def __init__(self, fmt: str):
+        super().__init__(fmt)
+        self._offset_hour = None  # Epoch hour the cached offset was read in
+        self._utc_offset = 0      # Seconds east of UTC at that hour
+
+    def formatTime(self, record, datefmt=None):
+        seconds = int(record.created)
+        hour = seconds // 3600
+        if hour != self._offset_hour:
+            self._offset_hour = hour
+            self._utc_offset = time.localtime(seconds).tm_gmtoff
+        seconds_of_day = (seconds + self._utc_offset) % 86400
+        return "%02d:%02d:%02d" % (seconds_of_day // 3600, seconds_of_day // 60 % 60, seconds_of_day % 60)
+
+
+def _configure_logging():
+    """
+    Sends log records to stdout with a [HH:MM:SS] prefix, without forcing a
+    flush per record (see `_UnflushedStreamHandler`).
+    """
+    console = _UnflushedStreamHandler(sys.stdout)
+    console.setFormatter(_ClockFormatter("[%(asctime)s] %(message)s"))
+    logger.addHandler(console)
+    logger.setLevel(logging.INFO)
+
+
+def _flush_log():
+    """Flushes the streams of the console handlers attached by `_configure_logging`."""
+    for handler in logger.handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.stream.flush()
+
+
+class FailSafeException(Exception):
+    """Raised when the mouse cursor is found in the top-left corner of the screen."""
+
+
+def _load_pyautogui():
+    """
+    Imports and returns pyautogui on first use, with its FAILSAFE enabled.
+    pyautogui (and the PIL/pyscreeze stack it pulls in) is only needed when the
+    Win32 APIs are unavailable, so it is not imported at program start.
+    Exits the program with an install hint if pyautogui is not installed.
+    """
+    try:
+        import pyautogui
+    except ImportError:
+        logger.error("Error: The 'pyautogui' library is required but not found.")
+        logger.error("Please install it using: pip install pyautogui")
+        sys.exit(1) # Exit the program if a critical dependency is missing
+    
+    # Enable pyautogui's FAILSAFE feature. Moving the mouse to the top-left
+    # corner (0,0) of the screen will raise a pyautogui.FailSafeException.
+    pyautogui.FAILSAFE = True
+    return pyautogui
+
+
+# Seconds between two consecutive clicks.
+CLICK_INTERVAL = 5.0
+
+# A screen region as (left, top, right, bottom) pixel coordinates, bounds inclusive.
+Region = Tuple[int, int, int, int]
+
+
+# Constants and structures for the Win32 SendInput API, as documented on MSDN.
+# Calling user32 directly avoids pyautogui's per-call PAUSE and Python overhead.
+INPUT_MOUSE = 0
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.POINTER(wintypes.ULONG)),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    class _INPUT(ctypes.Union):
+        _fields_ = [("mi", MOUSEINPUT)]
+
+    _anonymous_ = ("_input",)
+    _fields_ = [
+        ("type", wintypes.DWORD),
+        ("_input", _INPUT),
+    ]
+
+
+if sys.platform == "win32":
+    USER32 = ctypes.windll.user32
+    # A left-click is a button-down immediately followed by a button-up,
+    # submitted to the input stream in a single SendInput call.
+    _CLICK_INPUTS = (INPUT * 2)(
+        INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dwFlags=MOUSEEVENTF_LEFTDOWN)),
+        INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dwFlags=MOUSEEVENTF_LEFTUP)),
+    )
+else:
+    USER32 = None
+
+# DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2, a pseudo-handle defined as (HANDLE)-4.
+DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = ctypes.c_void_p(-4)
+PROCESS_PER_MONITOR_DPI_AWARE = 2
+
+
+def _enable_dpi_awareness():
+    """
+    Declares the process DPI aware, so that Windows reports and accepts
+    physical pixel coordinates instead of silently rescaling them on
+    high-DPI displays. Tries the newest API first and falls back to the
+    older ones on earlier Windows versions.
+    """
+    if USER32 is None:
+        return
+    try:
+        # Windows 10 1703 and later.
+        if USER32.SetProcessDpiAwarenessContext(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2):
+            return
+    except AttributeError:
+        pass
+    try:
+        # Windows 8.1 and later. Returns S_OK (0) on success.
+        if ctypes.windll.shcore.SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE) == 0:
+            return
+    except (AttributeError, OSError):
+        pass
+    try:
+        # Windows Vista and later: system-wide DPI awareness only.
+        USER32.SetProcessDPIAware()
+    except AttributeError:
+        logger.warning("Warning: Could not enable DPI awareness. Coordinates may be scaled on high-DPI displays.")
 
 
 class RandomMouseMover:
     """A class to encapsulate the functionality of moving the mouse randomly and clicking."""
 
-    def __init__(self):
-        """Initializes the RandomMouseMover with default states and screen dimensions."""
+    def __init__(self, verbose: bool = True):
+        """
+        Initializes the RandomMouseMover with default states and screen dimensions.
+        If `verbose` is False, the per-click status line is not printed.
+        """
         self.running = False  # Flag to control the main loop of the mouse mover
-        self.thread = None    # Thread object for running the mouse movement loop
+        self.verbose = verbose  # Whether to print a status line for every click
+        self.task = None      # asyncio task running the mouse movement loop
+        self._loop = None     # Event loop the mouse mover runs on, set by `start`
+        self._finished = None # Future resolved by `stop` to end `mouse_mover_loop`
+        self._pending_click = None  # Timer handle of the single scheduled click
+        self._display_thread = None  # Thread pumping WM_DISPLAYCHANGE messages
+        self._cached_size = None  # Primary monitor size, reset by `refresh`
+        # Guards the screen size, avoidance mask and position pool, which
+        # `refresh` replaces from the display listener thread.
+        self._geometry_lock = threading.Lock()
+        
+        if not WINDOWS_AVAILABLE:
+            logger.warning("Warning: win32api not available. Will use pyautogui screen detection, which may not accurately detect primary monitor in multi-monitor setups.")
         
-        # Enable pyautogui's FAILSAFE feature. Moving the mouse to the top-left
-        # corner (0,0) of the screen will raise a pyautogui.FailSafeException
-        # and stop the program, providing an emergency stop mechanism.
-        pyautogui.FAILSAFE = True
+        # Opt into DPI awareness before the monitor size is read, so that it is
+        # reported in the same physical pixels that SetCursorPos expects.
+        _enable_dpi_awareness()
         
         # Determine the dimensions of the primary monitor.
         # This is crucial for ensuring the mouse stays within a single screen.
         self.screen_width, self.screen_height = self.get_primary_monitor_size()
-        print(f"Primary monitor size detected: {self.screen_width}x{self.screen_height}")
+        logger.info("Primary monitor size detected: %dx%d", self.screen_width, self.screen_height)
         
         # Define regions to avoid clicking. These are approximate and based on
         # typical Windows 11 UI layouts. These values might need adjustment
@@ -76,6 +263,11 @@ class RandomMouseMover:
         self.avoid_regions = []
         self._define_avoid_regions()
 
+        # Pool of pre-sampled click positions that are already known to lie
+        # outside the avoidance regions. Refilled in batches when exhausted.
+        self._pos_pool = deque()
+        self._rng_np = np.random.default_rng()  # Dedicated generator for position batches
+
     def _define_avoid_regions(self):
         """
         Defines approximate screen regions to avoid clicking.
@@ -116,154 +308,329 @@ class RandomMouseMover:
             self.screen_height                     # Bottom: to very bottom edge
         ))
 
-        print("Defined avoidance regions:")
+        # Collapse overlapping regions (e.g. the Start area lies inside the
+        # taskbar strip) so each area is listed and rasterized only once.
+        self.avoid_regions = self._merge_regions(self.avoid_regions)
+
+        logger.info("Defined avoidance regions:")
         for region in self.avoid_regions:
-            print(f"  {region}")
+            logger.info("  %s", region)
+
+        # Rasterize the regions into a (height, width) boolean mask once, so that
+        # checking a position is a single array lookup instead of a region scan.
+        # Region bounds are inclusive, hence the +1 on the slice ends.
+        self._avoid_mask = np.zeros((self.screen_height, self.screen_width), dtype=np.bool_)
+        for left, top, right, bottom in self.avoid_regions:
+            self._avoid_mask[max(top, 0):bottom + 1, max(left, 0):right + 1] = True
+
+    @staticmethod
+    def _union_if_rectangle(a: Region, b: Region) -> Optional[Region]:
+        """
+        Returns the union of two regions if that union is itself a rectangle,
+        i.e. one contains the other, or they share a full edge span and overlap
+        or touch along it. Returns None otherwise.
+        """
+        a_left, a_top, a_right, a_bottom = a
+        b_left, b_top, b_right, b_bottom = b
+        if a_left <= b_left and a_top <= b_top and b_right <= a_right and b_bottom <= a_bottom:
+            return a  # b lies inside a
+        if b_left <= a_left and b_top <= a_top and a_right <= b_right and a_bottom <= b_bottom:
+            return b  # a lies inside b
+        # Bounds are inclusive, so regions one pixel apart still touch.
+        if a_top == b_top and a_bottom == b_bottom and b_left <= a_right + 1 and a_left <= b_right + 1:
+            return (min(a_left, b_left), a_top, max(a_right, b_right), a_bottom)
+        if a_left == b_left and a_right == b_right and b_top <= a_bottom + 1 and a_top <= b_bottom + 1:
+            return (a_left, min(a_top, b_top), a_right, max(a_bottom, b_bottom))
+        return None
+
+    @classmethod
+    def _merge_regions(cls, regions: List[Region]) -> List[Region]:
+        """
+        Merges regions pairwise until no two regions can be combined into a
+        single rectangle. The result covers exactly the same pixels.
+        """
+        merged = sorted(regions, key=lambda region: (region[1], region[0]))
+        changed = True
+        while changed:
+            changed = False
+            for i, j in itertools.combinations(range(len(merged)), 2):
+                union = cls._union_if_rectangle(merged[i], merged[j])
+                if union is not None:
+                    merged[i] = union
+                    del merged[j]
+                    changed = True
+                    break
+        return merged
 
     def is_position_in_avoid_region(self, x: int, y: int) -> bool:
         """
         Checks if a given (x, y) coordinate falls within any defined avoidance region.
+        Positions outside the primary monitor are never in an avoidance region.
+        Kept as public API for callers: the click loop itself no longer needs it,
+        since `_refill_position_pool` filters candidates against the mask directly.
         """
-        for region in self.avoid_regions:
-            left, top, right, bottom = region
-            if left <= x <= right and top <= y <= bottom:
-                return True
-        return False
+        # Hold the lock so the bounds check and the lookup see the same geometry,
+        # even if `refresh` replaces it from the display listener thread.
+        with self._geometry_lock:
+            if not (0 <= x < self.screen_width and 0 <= y < self.screen_height):
+                return False
+            return bool(self._avoid_mask[y, x])
 
     def get_primary_monitor_size(self) -> Tuple[int, int]:
+        """ 
+        Returns the width and height of the primary monitor.
+        The size is queried once and cached until `refresh` is called, which
+        happens automatically when Windows reports a display change.
+        """
+        if self._cached_size is None:
+            self._cached_size = self._query_primary_monitor_size()
+        return self._cached_size
+
+    def _query_primary_monitor_size(self, fallback: bool = True) -> Optional[Tuple[int, int]]:
         """ 
         Determines and returns the width and height of the primary monitor.
         Prioritizes `win32api` for accurate multi-monitor detection on Windows.
         Falls back to `pyautogui.size()` if `win32api` is not available or fails.
+        If `fallback` is False, a failing `win32api` call returns None instead.
         """
         if WINDOWS_AVAILABLE:
-            try:
-                # Get information about the primary monitor.
-                # MonitorFromPoint((0,0)) returns the handle to the monitor
-                # that contains the point (0,0), which is typically the primary monitor.
-                primary_monitor = win32api.GetMonitorInfo(win32api.MonitorFromPoint((0, 0)))
-                
-                # The 'Monitor' key in the returned dictionary contains a tuple
-                # (left, top, right, bottom) representing the monitor's coordinates.
-                monitor_area = primary_monitor["Monitor"]
-                width = monitor_area[2] - monitor_area[0]  # right - left
-                height = monitor_area[3] - monitor_area[1] # bottom - top
+            # SM_CXSCREEN/SM_CYSCREEN are the width and height of the primary
+            # monitor, each returned by a single call as a plain integer.
+            width = win32api.GetSystemMetrics(win32con.SM_CXSCREEN)
+            height = win32api.GetSystemMetrics(win32con.SM_CYSCREEN)
+            if width and height:
                 return width, height
-            except Exception as e:
-                print(f"Error getting primary monitor info via Windows API: {e}. Falling back to pyautogui.size().")
+            # GetSystemMetrics returns 0 instead of raising when it fails.
+            if not fallback:
+                return None
+            logger.error("Error getting primary monitor size via Windows API. Falling back to pyautogui.size().")
         
         # Fallback if win32api is not available or an error occurs.
         # pyautogui.size() returns the size of the entire virtual screen,
         # which spans across all monitors in a multi-monitor setup.
-        return pyautogui.size()
+        return _load_pyautogui().size()
+
+    def refresh(self):
+        """
+        Re-reads the primary monitor size and rebuilds everything derived from it:
+        the avoidance regions, their mask and the pool of pre-sampled positions.
+        Usually runs on the display listener thread, so a failing Windows API call
+        does not fall back to pyautogui (which may exit the program if missing);
+        the previous size is kept instead, e.g. while the display is settling.
+        """
+        size = self._query_primary_monitor_size(fallback=False)
+        if size is None:
+            logger.warning("Display change detected, but the new monitor size could not be read. Keeping %dx%d.",
+                           self.screen_width, self.screen_height)
+            return
+        
+        with self._geometry_lock:
+            self._cached_size = size
+            self.screen_width, self.screen_height = size
+            logger.info("Display change detected. Primary monitor size: %dx%d", self.screen_width, self.screen_height)
+            self.avoid_regions = []
+            self._define_avoid_regions()
+            self._pos_pool.clear()
+
+        # Replace the pending click with a fresh one a full interval away, so no
+        # click lands while the display is still settling. `refresh` is usually
+        # called from the display listener thread, hence call_soon_threadsafe.
+        # The is_closed check is only a fast path: the loop thread can still close
+        # the loop before the call, and then there is nothing to reschedule.
+        if self.running and self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._schedule_click, CLICK_INTERVAL)
+            except RuntimeError:
+                pass
+
+    def _display_message_pump(self):
+        """
+        Creates a hidden top-level window and pumps its messages forever, so that
+        the WM_DISPLAYCHANGE broadcast sent on resolution changes calls `refresh`.
+        Runs in its own daemon thread; see `start`.
+        """
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg == win32con.WM_DISPLAYCHANGE:
+                self.refresh()
+                return 0
+            return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+
+        try:
+            window_class = win32gui.WNDCLASS()
+            window_class.lpfnWndProc = wnd_proc
+            window_class.lpszClassName = "RandomMouseMoverDisplayListener"
+            window_class.hInstance = win32api.GetModuleHandle(None)
+            class_atom = win32gui.RegisterClass(window_class)
+            # A message-only window would not receive broadcasts, so create a
+            # regular top-level window that is simply never shown.
+            win32gui.CreateWindow(class_atom, "", 0, 0, 0, 0, 0, 0, 0, window_class.hInstance, None)
+            win32gui.PumpMessages()
+        except Exception as e:
+            logger.error("Error listening for display changes: %s. Monitor size will not be refreshed.", e)
     
+    def _refill_position_pool(self, batch_size: int = 256):
+        """
+        Samples a batch of random positions in one vectorized call and keeps
+        those outside the avoidance regions. Loops until at least one position
+        survives, which only repeats if the regions cover most of the screen.
+        """
+        margin = 50  # Pixels from the edge to avoid
+        
+        while not self._pos_pool:
+            # Generate random X and Y coordinates within the screen, respecting the margin.
+            xs = self._rng_np.integers(margin, self.screen_width - margin, size=batch_size, endpoint=True)
+            ys = self._rng_np.integers(margin, self.screen_height - margin, size=batch_size, endpoint=True)
+            
+            # Reject every candidate that falls in an avoidance region at once.
+            keep = ~self._avoid_mask[ys, xs]
+            self._pos_pool.extend(zip(xs[keep].tolist(), ys[keep].tolist()))
+
     def get_random_position(self) -> Tuple[int, int]:
         """ 
-        Generates a random (x, y) coordinate within the bounds of the primary monitor.
+        Returns a random (x, y) coordinate within the bounds of the primary monitor
+        that lies outside the avoidance regions.
         A small margin is applied to prevent the cursor from going to the very edges,
         which can sometimes trigger unintended system behaviors or failsafe.
         """
-        margin = 50  # Pixels from the edge to avoid
-        
-        # Generate random X coordinate within the screen width, respecting the margin.
-        x = random.randint(margin, self.screen_width - margin)
-        
-        # Generate random Y coordinate within the screen height, respecting the margin.
-        y = random.randint(margin, self.screen_height - margin)
-        
-        return x, y
+        with self._geometry_lock:
+            if not self._pos_pool:
+                self._refill_position_pool()
+            return self._pos_pool.popleft()
     
     def move_mouse_and_click(self):
         """ 
         Moves the mouse cursor to a newly generated random position and performs a left-click.
-        The movement is performed smoothly over a short duration. It attempts to avoid
-        clicking in predefined UI sensitive regions.
+        Positions come from `get_random_position`, which already excludes the
+        predefined UI sensitive regions.
         """
         try:
             x, y = self.get_random_position()
+
+            if USER32 is not None:
+                # Moving the mouse to the top-left corner (0,0) of the screen
+                # stops the program, providing an emergency stop mechanism.
+                point = wintypes.POINT()
+                USER32.GetCursorPos(ctypes.byref(point))
+                if (point.x, point.y) == (0, 0):
+                    raise FailSafeException("Mouse moved to top-left corner.")
+
+                # Jump straight to (x, y) and click with a single SendInput call.
+                USER32.SetCursorPos(x, y)
+                USER32.SendInput(len(_CLICK_INPUTS), _CLICK_INPUTS, ctypes.sizeof(INPUT))
+            else:
+                # Move to (x, y) and left-click in one call. Without a `duration`,
+                # pyautogui jumps straight there instead of animating the move.
+                pyautogui = _load_pyautogui()
+                try:
+                    pyautogui.click(x, y)
+                except pyautogui.FailSafeException as e:
+                    raise FailSafeException(str(e)) from e
             
-            # Check if the generated position is in an avoidance region
-            if self.is_position_in_avoid_region(x, y):
-                print(f"Skipping click at ({x}, {y}) as it's in an avoidance region.")
-                return # Do not click if in an avoidance region
-
-            # Move the mouse cursor to the generated (x, y) position.
-            # The `duration` parameter makes the movement visible and smooth.
-            pyautogui.moveTo(x, y, duration=0.5)
-            
-            # Perform a left-click at the new position
-            pyautogui.click()
-            
-            current_time = time.strftime("%H:%M:%S")
-            print(f"[{current_time}] Mouse moved to: ({x}, {y}) and clicked.")
+            # Skip creating a log record at all when running quietly.
+            if self.verbose:
+                logger.info("Mouse moved to: (%d, %d) and clicked.", x, y)
             
+        except FailSafeException:
+            # Let the failsafe propagate so `mouse_mover_loop` can stop the program.
+            raise
         except Exception as e:
-            print(f"Error moving mouse or clicking: {e}")
+            logger.error("Error moving mouse or clicking: %s", e)
     
-    def mouse_mover_loop(self):
-        """ 
-        The main loop that continuously moves the mouse cursor and clicks.
-        It runs as long as the `self.running` flag is True.
+    def _schedule_click(self, delay: float):
+        """
+        Schedules the next click `delay` seconds from now, replacing the
+        pending one if there is any. At most one click is ever pending, so
+        repeated reschedules never stack up clicks.
+        """
+        self._cancel_pending_click()
+        if self.running:
+            self._pending_click = self._loop.call_later(delay, self._click_tick)
+
+    def _cancel_pending_click(self):
+        """Cancels the pending click, if any."""
+        if self._pending_click is not None:
+            self._pending_click.cancel()
+            self._pending_click = None
+
+    def _click_tick(self):
+        """
+        Timer callback that moves the mouse and clicks, then schedules the next click.
         Includes error handling for graceful termination.
         """
-        print("\nRandom mouse mover started. To stop: move mouse to top-left corner or press Ctrl+C.")
+        self._pending_click = None
+        try:
+            self.move_mouse_and_click()
+        except FailSafeException:
+            # This exception is raised when the mouse is moved to the top-left corner.
+            logger.warning("Emergency stop triggered (mouse moved to top-left corner).")
+            self.stop() # Call stop method to clean up and exit
+        except Exception as e:
+            # Catch any other unexpected errors during execution.
+            logger.error("An unexpected error occurred: %s", e)
+            self.stop() # Attempt to stop gracefully
+        else:
+            self._schedule_click(CLICK_INTERVAL)
+
+    async def mouse_mover_loop(self):
+        """ 
+        Keeps the mouse mover alive for as long as it runs. The clicks themselves
+        are driven by a single pending timer (see `_schedule_click`); this
+        coroutine only arms the first click and waits until `stop` resolves
+        `self._finished`. Ctrl+C is handled by `asyncio.run` in `main`, which
+        cancels this task; `self.running` is cleared either way on exit.
+        """
+        logger.info("Random mouse mover started. To stop: move mouse to top-left corner or press Ctrl+C.")
         
-        while self.running:
-            try:
-                self.move_mouse_and_click()
-                
-                # Wait for 5 seconds before the next move.
-                # The sleep is broken into smaller intervals to allow for quicker
-                # response to the `self.running` flag change (e.g., when stopping).
-                for _ in range(50):  # 50 iterations * 0.1 seconds/iteration = 5 seconds total
-                    if not self.running:
-                        break  # Exit the inner loop if stop is requested
-                    time.sleep(0.1)
-                    
-            except pyautogui.FailSafeException:
-                # This exception is raised when the mouse is moved to the top-left corner.
-                print("\nEmergency stop triggered (mouse moved to top-left corner).")
-                self.stop() # Call stop method to clean up and exit
-                break      # Exit the main loop
-            except KeyboardInterrupt:
-                # This exception is raised when Ctrl+C is pressed in the console.
-                print("\nKeyboard interrupt received.")
-                self.stop() # Call stop method to clean up and exit
-                break      # Exit the main loop
-            except Exception as e:
-                # Catch any other unexpected errors during execution.
-                print(f"An unexpected error occurred: {e}")
-                self.stop() # Attempt to stop gracefully
-                break      # Exit the main loop
+        self._schedule_click(0)
+        try:
+            await self._finished
+        finally:
+            # Also reached on cancellation, where `stop` may only run once the
+            # loop is already closed; clear the flag so `refresh` stops using it.
+            self.running = False
+            self._cancel_pending_click()
     
     def start(self):
         """ 
-        Starts the mouse movement and clicking loop in a new daemon thread.
-        A daemon thread runs in the background and automatically terminates
-        when the main program exits.
+        Starts the mouse movement and clicking loop as a task on the running
+        asyncio event loop. Must be called from within that loop (see `run`).
         """
         if self.running:
-            print("Mouse mover is already running.")
+            logger.info("Mouse mover is already running.")
             return
         
         self.running = True
-        # Create and start the thread. `daemon=True` ensures the thread exits
-        # when the main program exits, preventing it from hanging.
-        self.thread = threading.Thread(target=self.mouse_mover_loop, daemon=True)
-        self.thread.start()
+        self._loop = asyncio.get_running_loop()
+        self._finished = self._loop.create_future()
+        self.task = asyncio.create_task(self.mouse_mover_loop())
+
+        # Listen for display changes so the cached monitor size stays correct.
+        # The listener outlives stop/start cycles, so it is only started once.
+        if WINDOWS_AVAILABLE and self._display_thread is None:
+            self._display_thread = threading.Thread(target=self._display_message_pump, daemon=True)
+            self._display_thread.start()
     
     def stop(self):
         """ 
         Stops the mouse movement and clicking loop.
-        Sets the `self.running` flag to False, which signals the `mouse_mover_loop`
-        to terminate. It then waits for the thread to finish.
+        Sets the `self.running` flag to False, cancels the pending click and
+        resolves `self._finished`, which lets `mouse_mover_loop` return at once.
+        Must be called from the event loop's thread.
         """
         self.running = False
-        if self.thread and self.thread.is_alive():
-            # Wait for the thread to complete its current operation and exit.
-            # A timeout is provided to prevent indefinite waiting.
-            self.thread.join(timeout=1)
-        print("Random mouse mover stopped.")
+        self._cancel_pending_click()
+        if self._finished is not None and not self._finished.done():
+            self._finished.set_result(None)
+        logger.info("Random mouse mover stopped.")
+        _flush_log()
+
+    async def run(self):
+        """
+        Starts the mouse mover and waits until its loop finishes, either
+        through `stop`, the failsafe, or an unexpected error.
+        """
+        self.start()
+        await self.task
 
 
 def main():
@@ -272,41 +639,36 @@ def main():
     Initializes the mouse mover and handles the main program flow,
     including initial checks and graceful shutdown.
     """
+    parser = argparse.ArgumentParser(description="Move the mouse to a random position and click every few seconds.")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Do not log a status line for every click (e.g. for long unattended runs).")
+    args = parser.parse_args()
+    
     print("=" * 50)
     print("Random Mouse Mover for Windows 11")
     print("=" * 50)
     
-    # Basic check to ensure pyautogui is installed.
-    # Although setup.bat handles this, it's good practice for direct execution.
-    try:
-        import pyautogui
-    except ImportError:
-        print("Error: The 'pyautogui' library is required but not found.")
-        print("Please install it using: pip install pyautogui")
-        sys.exit(1) # Exit the program if a critical dependency is missing
+    _configure_logging()
     
     # Create an instance of the RandomMouseMover class.
-    mover = RandomMouseMover()
+    mover = RandomMouseMover(verbose=not args.quiet)
     
     try:
-        # Start the mouse movement.
-        mover.start()
-        
-        # Keep the main thread alive while the mouse mover thread runs.
-        # This prevents the program from exiting immediately after starting the thread.
-        while mover.running:
-            time.sleep(1) # Sleep to reduce CPU usage while waiting
+        # Start the mouse movement and block until it stops.
+        # On Ctrl+C, asyncio.run cancels the loop and raises KeyboardInterrupt.
+        asyncio.run(mover.run())
             
     except KeyboardInterrupt:
         # Handle Ctrl+C gracefully.
-        print("\nCtrl+C detected. Stopping the mouse mover...")
+        logger.info("Ctrl+C detected. Stopping the mouse mover...")
         mover.stop()
     except Exception as e:
         # Catch any unexpected errors in the main thread.
-        print(f"An unhandled error occurred in the main program: {e}")
+        logger.error("An unhandled error occurred in the main program: %s", e)
         mover.stop()
     
-    print("Program finished.")
+    logger.info("Program finished.")
+    _flush_log()
 
 
 if __name__ == "__main__":